@@ -1,19 +1,30 @@
 import asyncio
-import json
+import hashlib
 import os
 import random
-import requests
+import time
+import aiohttp
+import orjson
+from collections import deque
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import datetime, timezone
 from playwright.async_api import async_playwright, Error as PlaywrightError
 
 # === CONFIG ===
 load_dotenv()
 WEBHOOK_URL = os.getenv("WEBHOOK_URL")
 DISCORD_FORUM_URL = "https://discord.com/channels/1000384021542469632/1303601992169426995"
+# Optional comma-separated list of forum URLs; all tabs share one Chromium
+FORUM_URLS = [u.strip() for u in os.getenv("FORUM_URLS", DISCORD_FORUM_URL).split(",") if u.strip()]
 STATE_FILE = "discord_state.json"
-THREADS_FILE = "seen_threads.json"
+THREADS_FILE = "seen_threads.log"
+LEGACY_THREADS_FILE = "seen_threads.json"  # pre-log JSON list, migrated on load
 MAX_SEEN_THREADS = 20
+BLOCKED_THREAD_ID = "1303609863024148602"  # announcements you dunce
+
+# How long an intercepted threads API response counts as "fresh" before we
+# fall back to DOM scraping
+API_FRESH_SECONDS = 120
 
 if not WEBHOOK_URL:
     raise ValueError("WEBHOOK_URL not found in .env file")
@@ -21,6 +32,9 @@ if not WEBHOOK_URL:
 # Headless / UI
 HEADLESS = False
 
+# Resource types we never need for reading thread text from the forum list
+BLOCKED_RESOURCE_TYPES = {"image", "stylesheet", "font", "media", "imageset", "beacon", "csp_report"}
+
 ROLE_PING_ID = os.getenv("ROLE_PING_ID", None) # optional
 
 # === STYLE CONFIG ===
@@ -28,78 +42,223 @@ FOOTER_TEXT = "brought to you by arle."
 FOOTER_ICON = "https://i.imgur.com/JdlwG9w.jpeg"
 USERNAME = "Arlecchino"
 
-# Helper: load/save seen threads
-def load_seen_threads():
-    if os.path.exists(THREADS_FILE):
+# Static parts of the webhook payload, built once; only title/description
+# change per notification
+MENTION = f"<@&{ROLE_PING_ID}>" if ROLE_PING_ID else ""
+BASE_PAYLOAD = {
+    "username": USERNAME,
+    "content": MENTION,
+    "embeds": [{
+        "title": None,
+        "description": None,
+        "timestamp": None,
+        "footer": {
+            "text": FOOTER_TEXT,
+            "icon_url": FOOTER_ICON
+        },
+    }]
+}
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Fallback timestamp; utcnow() is deprecated and this is only needed when a
+# thread carries no timestamp of its own
+def utc_now_iso():
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+# Bounded collection of seen thread ids: set for O(1) membership, deque for
+# insertion order and eviction once MAX_SEEN_THREADS is hit.
+class SeenThreads:
+    def __init__(self, ids, path=THREADS_FILE):
+        self.order = deque(ids, maxlen=MAX_SEEN_THREADS)
+        self.ids = set(self.order)
+        self.pending = []  # ids added since the last flush to disk
+        self.path = path
+
+    def __contains__(self, thread_id):
+        return thread_id in self.ids
+
+    def add(self, thread_id):
+        if thread_id in self.ids:
+            return
+        if len(self.order) == self.order.maxlen:
+            self.ids.discard(self.order[0])
+        self.order.append(thread_id)
+        self.ids.add(thread_id)
+        self.pending.append(thread_id)
+
+    def to_list(self):
+        return list(self.order)
+
+# Each monitored forum gets its own log; the original single-forum file keeps
+# its name so existing state survives the upgrade
+def threads_file_for(url):
+    if url == DISCORD_FORUM_URL:
+        return THREADS_FILE
+    channel_id = url.rstrip("/").split("/")[-1]
+    return f"seen_threads_{channel_id}.log"
+
+# Helper: load/save seen threads. The log is one id per line, append-only;
+# we compact it back to the last MAX_SEEN_THREADS lines once at startup.
+def load_seen_threads(path=THREADS_FILE):
+    ids = []
+    if os.path.exists(path):
+        try:
+            with open(path, "r") as f:
+                ids = [line.strip() for line in f if line.strip()]
+        except Exception:
+            return []
+    elif path == THREADS_FILE and os.path.exists(LEGACY_THREADS_FILE):
+        # One-time migration from the old JSON-list format
         try:
-            with open(THREADS_FILE, "r") as f:
-                return json.load(f)  # list, ordered
+            with open(LEGACY_THREADS_FILE, "rb") as f:
+                ids = orjson.loads(f.read())
         except Exception:
             return []
-    return []
+    ids = ids[-MAX_SEEN_THREADS:]
+    try:
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            f.writelines(i + "\n" for i in ids)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"[Error] Could not compact seen threads file: {e}")
+    return ids
 
-def save_seen_threads(seen_list):
+def save_seen_threads(seen_threads):
     try:
-        # truncate to last MAX_SEEN_THREADS
-        seen_list[:] = seen_list[-MAX_SEEN_THREADS:]
-        with open(THREADS_FILE, "w") as f:
-            json.dump(seen_list, f)
+        pending, seen_threads.pending = seen_threads.pending, []
+        if pending:
+            with open(seen_threads.path, "ab") as f:
+                f.write("".join(i + "\n" for i in pending).encode())
     except Exception as e:
         print(f"[Error] Could not write seen threads file: {e}")
 
-# Send webhook (simple blocking requests.post like your other scripts)
-def send_payload(payload):
+# Shared aiohttp session, created in run() once the event loop exists
+AIOHTTP_SESSION = None
+
+# Monotonic time before which we must not POST again (set from Discord's
+# rate-limit headers)
+WEBHOOK_NEXT_ALLOWED_TS = 0.0
+
+def _header_float(headers, name):
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+# Send webhook (async so it doesn't block the Playwright event loop), pacing
+# ourselves off X-RateLimit-* so bursts of new threads don't burn 429s
+async def send_payload(body):
+    global WEBHOOK_NEXT_ALLOWED_TS
     try:
-        response = requests.post(WEBHOOK_URL, json=payload)
-        print(f"[Webhook] Status: {response.status_code}")
-        return response.status_code
+        delay = WEBHOOK_NEXT_ALLOWED_TS - time.monotonic()
+        if delay > 0:
+            print(f"[Webhook] Rate limited, waiting {delay:.2f}s...")
+            await asyncio.sleep(delay)
+
+        for attempt in range(2):
+            async with AIOHTTP_SESSION.post(WEBHOOK_URL, data=body, headers=JSON_HEADERS) as response:
+                status = response.status
+                remaining = _header_float(response.headers, "X-RateLimit-Remaining")
+                reset_after = _header_float(response.headers, "X-RateLimit-Reset-After")
+                if remaining == 0 and reset_after:
+                    WEBHOOK_NEXT_ALLOWED_TS = time.monotonic() + reset_after
+                if status != 429:
+                    print(f"[Webhook] Status: {status}")
+                    return status
+                # Honor Retry-After precisely and retry once
+                retry_after = _header_float(response.headers, "Retry-After") or reset_after or 1.0
+                WEBHOOK_NEXT_ALLOWED_TS = time.monotonic() + retry_after
+                print(f"[Webhook] 429, retrying in {retry_after:.2f}s...")
+            await asyncio.sleep(retry_after)
+
+        print(f"[Webhook] Status: {status}")
+        return status
     except Exception as e:
         print(f"[Webhook Error] {e}")
         return None
 
+# Thread-card selectors, hoisted here so Discord's class-name churn only needs
+# fixing in one place
+LIST_SELECTOR = 'div[role="list"].content_d125d2 li.card_f369db[data-item-role="item"]'
+TITLE_SEL = '[class*="title_f75fb0"], h3, [role="heading"]'
+AUTHOR_SEL = '[class*="author"], [class*="username"], span[class*="name"]'
+CONTENT_SEL = 'div[class*="messageContent_"], div[class*="preview_"], div[class*="markup_"]'
+CONTAINER_SEL = 'div[data-item-id]'
+
+# Extract every thread card in one in-page pass: one CDP round-trip instead of
+# ~5 query_selector hops per card. Selectors come in as arguments so the
+# constants above stay the single source of truth.
+EXTRACT_ALL_JS = """({ sel, title, author, content, container }) => Array.from(document.querySelectorAll(sel)).map(el => {
+    const q = (s) => { const n = el.querySelector(s); return n ? n.innerText : null; };
+    const c = el.querySelector(container);
+    const t = el.querySelector('time');
+    return {
+        id: c ? c.getAttribute('data-item-id') : null,
+        title: q(title),
+        author: q(author),
+        content: q(content),
+        timestamp: t ? t.getAttribute('datetime') : null
+    };
+})"""
+EXTRACT_ALL_ARGS = {
+    "sel": LIST_SELECTOR,
+    "title": TITLE_SEL,
+    "author": AUTHOR_SEL,
+    "content": CONTENT_SEL,
+    "container": CONTAINER_SEL
+}
+
+# Normalize a raw dict from EXTRACT_ALL_JS into the usual thread_data shape
+def normalize_scraped_thread(raw, now_iso, forum_url):
+    thread_id = raw.get("id")
+    return {
+        "id": thread_id,
+        "title": (raw.get("title") or "Untitled Thread").strip(),
+        "author": (raw.get("author") or "Unknown").strip(),
+        "content": (raw.get("content") or "").strip(),
+        "url": f"{forum_url}/threads/{thread_id}" if thread_id else "",
+        "timestamp": raw.get("timestamp") or now_iso
+    }
+
 # Extract thread info from a thread element (best-effort; selectors may need tweaks)
-async def extract_thread_data(thread_element):
+async def extract_thread_data(thread_element, now_iso, forum_url):
     try:
-        # Title
-        title_el = await thread_element.query_selector('[class*="title_f75fb0"], h3, [role="heading"]')
-        title = (await title_el.inner_text()) if title_el else "Untitled Thread"
-
-        # Author - try a few possible selectors
-        author_el = await thread_element.query_selector('[class*="author"], [class*="username"], span[class*="name"]')
-        author = (await author_el.inner_text()) if author_el else "Unknown"
-
-        # Content preview
-        message_el = await thread_element.query_selector(
-            'div[class*="messageContent_"], div[class*="preview_"], div[class*="markup_"]'
+        # All five lookups are independent CDP calls - fire them concurrently
+        # instead of paying the round-trip latency five times in a row
+        title_el, author_el, message_el, container, time_el = await asyncio.gather(
+            thread_element.query_selector(TITLE_SEL),
+            thread_element.query_selector(AUTHOR_SEL),
+            thread_element.query_selector(CONTENT_SEL),
+            thread_element.query_selector(CONTAINER_SEL),
+            thread_element.query_selector('time'),
         )
-        content = ""
-        if message_el:
-            content = await message_el.inner_text()
 
-        # Get container with real ID
-        container = await thread_element.query_selector('div[data-item-id]')
+        async def _text(el, default):
+            return (await el.inner_text()).strip() if el else default
 
-        thread_id = None
-        thread_url = ""
+        async def _attr(el, name):
+            return (await el.get_attribute(name)) if el else None
 
-        if container:
-            thread_id = await container.get_attribute("data-item-id")
-            thread_url = f"{DISCORD_FORUM_URL}/threads/{thread_id}"
+        # Same for the follow-up reads on whatever elements we found
+        title, author, content, thread_id, timestamp = await asyncio.gather(
+            _text(title_el, "Untitled Thread"),
+            _text(author_el, "Unknown"),
+            _text(message_el, ""),
+            _attr(container, "data-item-id"),
+            _attr(time_el, "datetime"),  # ISO if available
+        )
 
-        # Creation timestamp: best-effort find time element
-        timestamp = None
-        time_el = await thread_element.query_selector('time')
-        if time_el:
-            timestamp = await time_el.get_attribute('datetime')  # ISO if available
+        thread_url = f"{forum_url}/threads/{thread_id}" if thread_id else ""
         # fallback to now if not available
         if not timestamp:
-            timestamp = datetime.utcnow().isoformat() + "Z"
+            timestamp = now_iso
 
         return {
             "id": thread_id,
-            "title": title.strip(),
-            "author": author.strip(),
-            "content": content.strip(),
+            "title": title,
+            "author": author,
+            "content": content,
             "url": thread_url,
             "timestamp": timestamp
         }
@@ -107,78 +266,163 @@ async def extract_thread_data(thread_element):
         print(f"[Error extracting thread data] {e}")
         return None
 
+# Per-page interception state: monotonic timestamp of the last useful threads
+# API response, plus the URL/headers of that call so we can replay it instead
+# of hard-reloading. One dict per monitored page.
+def new_api_state():
+    return {"last_data_ts": 0.0, "url": None, "headers": {}}
+
+# Re-hit the threads endpoint from inside the page; the response flows through
+# the same page.on('response') interception as Discord's own calls.
+REFETCH_JS = """async ({ url, headers }) => {
+    const r = await fetch(url, { headers, credentials: "include" });
+    return r.ok;
+}"""
+
+# Shared by the API interception path and the DOM-scraping fallback:
+# dedupe against seen_threads, ping the webhook, persist.
+async def process_thread(thread_data, seen_threads):
+    thread_id = thread_data.get("id")
+    # If we couldn't find an ID, use a URL+title digest as fallback. blake2b is
+    # stable across restarts, unlike hash() with its per-process seed.
+    if not thread_id:
+        key = thread_data.get("url", "") + thread_data.get("title", "")
+        thread_id = "fallback:" + hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+    if thread_id == BLOCKED_THREAD_ID:
+        print(f"[Blocked Thread Ignored] {thread_data.get('title')} ({thread_id})")
+        seen_threads.add(thread_id)
+        return
+
+    if thread_id not in seen_threads:
+        # New thread detected
+        print(f"[New Thread] {thread_data.get('title')} by {thread_data.get('author')}")
+        # Mark seen *before* awaiting the webhook: the response handler and the
+        # DOM path run as separate tasks, and awaiting first would let both
+        # pass the membership check and double-ping the same thread.
+        # Persisting is debounced to once per loop cycle.
+        seen_threads.add(thread_id)
+        # Send webhook for every new thread
+        await post_new_thread_webhook(thread_data)
+
+# Intercept the JSON responses Discord's own app makes for the thread list.
+# Much faster and more stable than scraping class names that churn every deploy.
+def make_threads_response_handler(seen_threads, forum_url, api_state):
+    async def on_response(response):
+        url = response.url
+        if "/threads/search" not in url and "/threads/active" not in url:
+            return
+        try:
+            data = await response.json()
+        except Exception:
+            return
+        # Remember how to replay this call (auth headers included)
+        api_state["url"] = url
+        api_state["headers"] = {
+            k: v for k, v in response.request.headers.items()
+            if k.lower() in ("authorization", "x-super-properties", "x-discord-locale", "x-discord-timezone")
+        }
+        threads = data.get("threads") or []
+        if not threads:
+            return
+        # Never process more per batch than the seen window can hold, or the
+        # overflow evicts ids added this same batch and re-notifies them
+        # forever on the next pass
+        threads = threads[:MAX_SEEN_THREADS]
+        first_messages = {m.get("id"): m for m in data.get("first_messages") or []}
+        api_state["last_data_ts"] = time.monotonic()
+        print(f"[+] Intercepted threads API response with {len(threads)} threads")
+        for thread in threads:
+            try:
+                thread_id = str(thread.get("id") or "")
+                # Threads come back newest-first; everything past the first
+                # already-seen id is old news
+                if thread_id and thread_id in seen_threads and thread_id != BLOCKED_THREAD_ID:
+                    break
+                message = first_messages.get(thread_id) or {}
+                metadata = thread.get("thread_metadata") or {}
+                thread_data = {
+                    "id": thread_id or None,
+                    "title": (thread.get("name") or "Untitled Thread").strip(),
+                    "author": str(thread.get("owner_id") or "Unknown"),
+                    "content": (message.get("content") or "").strip(),
+                    "url": f"{forum_url}/threads/{thread_id}",
+                    "timestamp": metadata.get("create_timestamp") or utc_now_iso()
+                }
+                await process_thread(thread_data, seen_threads)
+            except Exception as e:
+                print(f"[Error processing API thread] {e}")
+    return on_response
+
 # Build and send webhook for a new thread
-def post_new_thread_webhook(thread_data):
+async def post_new_thread_webhook(thread_data):
     title = thread_data.get("title", "Untitled")
     thread_url = thread_data.get("url", "")
-    timestamp = thread_data.get("timestamp", datetime.utcnow().isoformat() + "Z")
+    timestamp = thread_data.get("timestamp") or utc_now_iso()
     content_preview = thread_data.get("content", "").strip()
 
-    # mention role if ROLE_PING_ID is set
-    mention = f"<@&{ROLE_PING_ID}>" if ROLE_PING_ID else ""
-    content = mention
-
-    embed = {
-        "title": title,
-
-        "description": content_preview if content_preview else "No preview available.",
-
-        "timestamp": None,
-        "footer": {
-            "text": FOOTER_TEXT,
-            "icon_url": FOOTER_ICON
-        },
-    }
+    # Patch the per-thread fields into the cached template and post the bytes
+    embed = BASE_PAYLOAD["embeds"][0]
+    embed["title"] = title
+    embed["description"] = content_preview if content_preview else "No preview available."
 
-    payload = {
-        "username": USERNAME,
-        "content": content,
-        "embeds": [embed]
-    }
-    send_payload(payload)
+    await send_payload(orjson.dumps(BASE_PAYLOAD))
     print(f"[+] Sent webhook for thread: {title} | {thread_url} | {timestamp}")
 
-async def forum_monitor_loop(page, seen_threads):
+async def forum_monitor_loop(page, forum_url, seen_threads, api_state):
     """
     Main loop: find thread elements, notify on unseen ones, persist seen IDs.
     This is resilient: continues on DOM errors and sleeps randomly between cycles.
     """
     scroll_counter = 0
+    refetch_failures = 0
+    list_locator = page.locator(LIST_SELECTOR)
     while True:
         try:
-            # Wait for some thread-like item to appear
-            await page.wait_for_selector('div[role="list"].content_d125d2 li.card_f369db[data-item-role="item"]', timeout=60000)
-
-            thread_elements = await page.query_selector_all(
-                'div[role="list"].content_d125d2 li.card_f369db[data-item-role="item"]'
-            )
-
-            print(f"[+] Found {len(thread_elements)} thread elements")
-
-            # Process newest-first to keep seen set consistent
-            for thread_el in thread_elements:
-                thread_data = await extract_thread_data(thread_el)
-                if not thread_data:
-                    continue
-                thread_id = thread_data.get("id")
-                # If we couldn't find an ID, use URL+title hash as fallback
-                if not thread_id:
-                    thread_id = f"fallback:{hash(thread_data.get('url','') + thread_data.get('title',''))}"
-
-                if thread_id == "1303609863024148602": # announcements you dunce
-                    print(f"[Blocked Thread Ignored] {thread_data.get('title')} ({thread_id})")
-                    seen_threads.append(thread_id)
-                    save_seen_threads(seen_threads)
-                    continue
-
-                if thread_id not in seen_threads:
-                    # New thread detected
-                    print(f"[New Thread] {thread_data.get('title')} by {thread_data.get('author')}")
-                    # Send webhook for every new thread
-                    post_new_thread_webhook(thread_data)
-                    # Mark seen and persist
-                    seen_threads.append(thread_id)
-                    save_seen_threads(seen_threads)
+            # When the intercepted API is feeding us threads, the loop is just a
+            # keepalive (scroll/reload to provoke more API calls). Only scrape
+            # the DOM if we haven't seen API data recently.
+            if time.monotonic() - api_state["last_data_ts"] > API_FRESH_SECONDS:
+                # Fast count() probe on the cached locator; only pay the full
+                # wait when no cards are mounted. state='attached' is enough
+                # since we read the DOM, and it skips visibility polling.
+                if await list_locator.count() == 0:
+                    await page.wait_for_selector(LIST_SELECTOR, state="attached", timeout=60000)
+
+                # Cards are listed newest-first and the seen window holds
+                # MAX_SEEN_THREADS ids, so anything past that is guaranteed
+                # already seen - don't pay to extract it. The window must not
+                # exceed the seen capacity, or one big cycle evicts ids it
+                # added itself and re-notifies them next cycle.
+                fresh_window = MAX_SEEN_THREADS
+                # One timestamp fallback per cycle, not per card
+                now_iso = utc_now_iso()
+
+                thread_datas = []
+                try:
+                    raw_threads = await page.evaluate(EXTRACT_ALL_JS, EXTRACT_ALL_ARGS)
+                    print(f"[+] Found {len(raw_threads)} thread elements")
+                    thread_datas = [normalize_scraped_thread(raw, now_iso, forum_url) for raw in raw_threads[:fresh_window]]
+                except PlaywrightError:
+                    raise
+                except Exception as e:
+                    # Batched extraction failed; fall back to per-element queries
+                    print(f"[Error in batched extraction] {e}")
+                    thread_elements = await page.query_selector_all(LIST_SELECTOR)
+                    print(f"[+] Found {len(thread_elements)} thread elements")
+                    for thread_el in thread_elements[:fresh_window]:
+                        thread_data = await extract_thread_data(thread_el, now_iso, forum_url)
+                        if thread_data:
+                            thread_datas.append(thread_data)
+
+                # Process newest-first to keep seen set consistent
+                for thread_data in thread_datas:
+                    await process_thread(thread_data, seen_threads)
+
+            # Persist once per cycle (covers both API and DOM paths), off the
+            # event-loop thread so Playwright IO keeps draining
+            if seen_threads.pending:
+                await asyncio.to_thread(save_seen_threads, seen_threads)
 
             # Randomize wait to mimic human
             wait_time = random.uniform(5, 12)
@@ -194,15 +438,35 @@ async def forum_monitor_loop(page, seen_threads):
                     print("[i] Could not scroll; page or browser closed.")
                     return
 
-            # Occasional reload to catch edge cases
+            # Occasional refresh to catch edge cases. Prefer replaying the
+            # threads API call we intercepted (no renderer teardown); only
+            # hard-reload if that keeps failing or was never captured.
             if scroll_counter % 40 == 0:
-                try:
-                    print("[+] Refreshing page...")
-                    await page.reload()
-                    await asyncio.sleep(2)
-                except PlaywrightError:
-                    print("[i] Page reload failed; page/browser closed.")
-                    return
+                refreshed = False
+                if api_state["url"] and refetch_failures < 3:
+                    try:
+                        print("[+] Re-fetching threads API...")
+                        ok = await page.evaluate(REFETCH_JS, {"url": api_state["url"], "headers": api_state["headers"]})
+                        if ok:
+                            refetch_failures = 0
+                            refreshed = True
+                        else:
+                            refetch_failures += 1
+                    except PlaywrightError:
+                        print("[i] Could not re-fetch; page or browser closed.")
+                        return
+                    except Exception as e:
+                        print(f"[Error re-fetching threads API] {e}")
+                        refetch_failures += 1
+                if not refreshed:
+                    try:
+                        print("[+] Refreshing page...")
+                        await page.reload()
+                        await asyncio.sleep(2)
+                        refetch_failures = 0
+                    except PlaywrightError:
+                        print("[i] Page reload failed; page/browser closed.")
+                        return
 
         except PlaywrightError as e:
             print(f"[i] Playwright Error: {e}")
@@ -211,9 +475,36 @@ async def forum_monitor_loop(page, seen_threads):
             print(f"[Error] {e}. Retrying in 10 seconds...")
             await asyncio.sleep(10)
 
+# Anti-detection
+ANTI_DETECT_JS = """Object.defineProperty(navigator, 'webdriver', { get: () => undefined });"""
+
+# Block heavy assets (avatars, emoji, fonts, video previews) - we only read DOM text
+async def block_assets(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+# One context + page per forum, all sharing the same browser process and login
+# state - much cheaper than a Chromium per target
+async def open_forum(browser, forum_url, seen_threads, api_state):
+    context = await browser.new_context(
+        viewport={"width": 1280, "height": 720},
+        storage_state=STATE_FILE
+    )
+    await context.add_init_script(ANTI_DETECT_JS)
+
+    page = await context.new_page()
+    await page.route("**/*", block_assets)
+    # Feed new threads straight from Discord's own API responses
+    page.on("response", make_threads_response_handler(seen_threads, forum_url, api_state))
+    await page.goto(forum_url)
+    print(f"[+] Opened forum: {forum_url}")
+    return page
+
 async def run():
+    global AIOHTTP_SESSION
     print("[+] Starting Forum Thread Monitor (simple webhook pinger)...")
-    seen_threads = load_seen_threads()
 
     async with async_playwright() as p:
         print("[+] Launching Chromium...")
@@ -228,34 +519,45 @@ async def run():
             ]
         )
 
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 720},
-            storage_state=STATE_FILE if os.path.exists(STATE_FILE) else None
-        )
-
-        # Anti-detection
-        await context.add_init_script("""Object.defineProperty(navigator, 'webdriver', { get: () => undefined });""")
-
         # Manual login if no state
         if not os.path.exists(STATE_FILE):
             print("[+] No saved state found. Please login manually...")
-            page = await context.new_page()
+            login_context = await browser.new_context(viewport={"width": 1280, "height": 720})
+            await login_context.add_init_script(ANTI_DETECT_JS)
+            page = await login_context.new_page()
             await page.goto("https://discord.com/login")
             print("[!] Login to Discord, then press ENTER to continue.")
             input()
-            await context.storage_state(path=STATE_FILE)
+            await login_context.storage_state(path=STATE_FILE)
             print("[+] Login state saved!")
-            await page.close()
+            await login_context.close()
 
-        page = await context.new_page()
-        await page.goto(DISCORD_FORUM_URL)
-        print(f"[+] Opened forum: {DISCORD_FORUM_URL}")
+        # One pooled session for every webhook post: keep-alive skips the
+        # TCP+TLS handshake after the first POST, and DNS answers are cached
+        AIOHTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
 
-        # Start monitor loop (this will run until page/browser is closed)
-        await forum_monitor_loop(page, seen_threads)
+        monitors = []
+        for forum_url in FORUM_URLS:
+            # Load (and compact) off-thread; blocking file IO never touches the loop
+            seen_threads = SeenThreads(
+                await asyncio.to_thread(load_seen_threads, threads_file_for(forum_url)),
+                path=threads_file_for(forum_url)
+            )
+            api_state = new_api_state()
+            page = await open_forum(browser, forum_url, seen_threads, api_state)
+            monitors.append(forum_monitor_loop(page, forum_url, seen_threads, api_state))
+
+        try:
+            # Run every monitor until its page/browser is closed
+            await asyncio.gather(*monitors)
+        finally:
+            await AIOHTTP_SESSION.close()
 
         # Clean up
-        print("[-] Monitor loop ended, closing browser...")
+        print("[-] Monitor loops ended, closing browser...")
         await browser.close()
 
 if __name__ == "__main__":